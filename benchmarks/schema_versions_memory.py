@@ -0,0 +1,80 @@
+"""
+Compares the memory held by Schema._versions when every version is kept as a
+_SchemaContentModel against the compact _SchemaVersionRecord store.
+
+    python -m benchmarks.schema_versions_memory [schemas] [versions]
+"""
+import gc
+import json
+import sys
+import tracemalloc
+
+from schema_registry.models import _SchemaContentModel, _SchemaVersionRecord
+
+
+def _describe_schema_response(schema_index: int, version: int) -> dict:
+    properties = {
+        f"field_{i}": {"title": f"Field {i}", "type": "string"} for i in range(40)
+    }
+    properties["timestamp"] = {"title": "Timestamp", "type": "string", "format": "date-time"}
+    content = {
+        "title": f"BenchmarkModel{schema_index}",
+        "type": "object",
+        "properties": properties,
+        "required": list(properties)[:version],
+    }
+    name = f"schema_registry.benchmark.BenchmarkModel{schema_index}"
+    return {
+        "SchemaArn": f"arn:aws:schemas:eu-west-1:740218546536:schema/TAPI-TEST/{name}",
+        "SchemaName": name,
+        "SchemaVersion": str(version),
+        "Type": "JSONSchemaDraft4",
+        "VersionCreatedDate": "2020-11-27T16:53:00Z",
+        "Content": json.dumps(content),
+    }
+
+
+def _measure(build, schemas: int, versions: int) -> int:
+    gc.collect()
+    tracemalloc.start()
+    store = {}
+    for schema_index in range(schemas):
+        store[schema_index] = {
+            str(version): build(_describe_schema_response(schema_index, version))
+            for version in range(1, versions + 1)
+        }
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return size
+
+
+def _content_model(response: dict):
+    model = _SchemaContentModel.parse_obj(response)
+    model.content_dict
+    return model
+
+
+def _version_record(response: dict):
+    record = _SchemaVersionRecord.from_content_model(
+        _SchemaContentModel.parse_obj(response)
+    )
+    record.content_dict
+    return record
+
+
+def main():
+    schemas = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    versions = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    before = _measure(_content_model, schemas, versions)
+    after = _measure(_version_record, schemas, versions)
+
+    print(f"{schemas} schemas x {versions} versions")
+    print(f"_SchemaContentModel:  {before / 2 ** 20:8.1f} MiB")
+    print(f"_SchemaVersionRecord: {after / 2 ** 20:8.1f} MiB")
+    print(f"reduction:            {100 * (1 - after / before):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
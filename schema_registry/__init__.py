@@ -1,4 +1,8 @@
 from .client import SchemaRegistry, Schema
-from .reflection import SchemaReflector, reflect_event, BaseEvent
+from .federation import FederatedSchemaRegistry, RegistrySource
+from .reflection import SchemaReflector, reflect_event, BaseEvent, LazyModel
 from .models import Event
-from .errors import SchemaRegistryError, ModelNotRegisteredError
+from .envelope import RawEvent, reflect_raw_event
+from .parallel import reflect_events
+from .columnar import ColumnarBatch, decode_columnar, reflect_events_columnar
+from .errors import SchemaRegistryError, ModelNotRegisteredError, SchemaNotFoundError, InvalidEnvelopeError
@@ -19,12 +19,24 @@ from schema_registry.models import (
     _SchemaVersionModel,
     _SchemaContentModel,
     _SchemaCreateUpdateModel,
+    _SchemaVersionRecord,
 )
 
 from schema_registry.errors import SchemaRegistryError, ModelNotRegisteredError
 
 logger = logging.getLogger("schema_registry")
 
+# Registries rebuilt from pickles, so each process creates one per spec.
+_restored_registries: dict = {}
+
+
+def _restore_registry(cls, args: tuple, kwargs: dict):
+    key = (cls, args, tuple(sorted(kwargs.items())))
+    if key not in _restored_registries:
+        _restored_registries[key] = cls(*args, **kwargs)
+
+    return _restored_registries[key]
+
 
 class Schema:
     def __init__(self, client, registry_name, schema_name):
@@ -32,7 +44,7 @@ class Schema:
         self.registry_name: str = registry_name
         self.schema_name = schema_name
 
-        self._versions: Dict[str, _SchemaContentModel] = {}
+        self._versions: Dict[str, _SchemaVersionRecord] = {}
         self.default_version: int = 0
 
         self._load_versions()
@@ -55,7 +67,7 @@ class Schema:
 
     def _get_schema_version_content(
         self, schema_version: _SchemaVersionModel
-    ) -> _SchemaContentModel:
+    ) -> _SchemaVersionRecord:
         describe_opts = dict(
             RegistryName=self.registry_name,
             SchemaName=self.schema_name,
@@ -63,9 +75,9 @@ class Schema:
         )
         response = self.schema_client.describe_schema(**describe_opts)
         content: _SchemaContentModel = _SchemaContentModel.parse_obj(response)
-        return content
+        return _SchemaVersionRecord.from_content_model(content)
 
-    def get(self, version=None) -> _SchemaContentModel:
+    def get(self, version=None) -> _SchemaVersionRecord:
         if not version:
             return self._versions[self.default_version]
         else:
@@ -84,12 +96,19 @@ class SchemaRegistry:
         self, registry_name: Optional[str] = None, *, prefix: str = None, **boto_opts
     ):
         self.registry_name: str = registry_name or "discovered-schemas"
+        self._boto_opts = boto_opts
         self.session = boto3.Session(**boto_opts)
         self.schema_client = self.session.client("schemas")
         self.prefix = prefix
         self._schemas: Dict[str, Schema] = {}
         self._model_schemas: Dict[Type[BaseModel], _SchemaCreateUpdateModel] = {}
 
+    def __reduce__(self):
+        # Sessions and clients can't be pickled, so other processes build
+        # their own registry from the same options.
+        kwargs = dict(self._boto_opts, prefix=self.prefix)
+        return _restore_registry, (SchemaRegistry, (self.registry_name,), kwargs)
+
     def load_schemas(self):
         paginator = self.schema_client.get_paginator("list_schemas")
         page_options = dict(RegistryName=self.registry_name)
@@ -107,6 +126,12 @@ class SchemaRegistry:
         schema = Schema(self.schema_client, self.registry_name, name)
         return schema
 
+    def find_schema(self, name) -> Optional[Schema]:
+        try:
+            return self.get_schema(name)
+        except self.schema_client.exceptions.NotFoundException:
+            return None
+
     def _get_schema_content_for_model(self, schema_name, model: Type[BaseModel]) -> _SchemaCreateUpdateModel:
         opts = dict(RegistryName=self.registry_name, SchemaName=schema_name)
         response = self.schema_client.describe_schema(**opts)
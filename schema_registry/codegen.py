@@ -0,0 +1,234 @@
+import argparse
+import json
+import keyword
+import re
+import sys
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Type
+
+from pydantic import BaseModel
+
+from schema_registry.client import SchemaRegistry
+from schema_registry.models import _SchemaContentModel
+from schema_registry.reflection import SchemaReflector
+
+_MODULE_HEADER = '''\
+# Generated by schema_registry.codegen from {detail_type}. Do not edit.
+from datetime import datetime
+from typing import Any, Optional
+
+from pydantic import Field
+
+from schema_registry.reflection import _ReflectedModel, register_precompiled_model
+'''
+
+_SCALAR_TYPES = {str: "str", int: "int", bool: "bool", float: "float", datetime: "datetime"}
+
+# Names the generated modules refer to, which models and fields must not shadow.
+_RESERVED_NAMES = {
+    "Any",
+    "Optional",
+    "Field",
+    "_ReflectedModel",
+    "register_precompiled_model",
+    *_SCALAR_TYPES.values(),
+}
+
+
+def _detail_type_for(version) -> str:
+    return "{}:{}".format(version.schema_arn.split("/", 1)[1], version.schema_version)
+
+
+def _render_type(type_) -> str:
+    if type_ is Any:
+        return "Any"
+
+    if type_ in _SCALAR_TYPES:
+        return _SCALAR_TYPES[type_]
+
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        return type_.__name__
+
+    raise NotImplementedError(f"Not able to generate the type: {type_}")
+
+
+def _is_plain_name(name: str) -> bool:
+    return (
+        name.isidentifier()
+        and not keyword.iskeyword(name)
+        and name not in _RESERVED_NAMES
+    )
+
+
+def _attribute_name(name: str) -> str:
+    if _is_plain_name(name):
+        return name
+
+    attribute = re.sub(r"\W", "_", name) + "_"
+    if not attribute[0].isalpha():
+        attribute = "field_" + attribute
+    return attribute
+
+
+def _render_field(name: str, attribute: str, field) -> str:
+    annotation = _render_type(field.outer_type_)
+    if not field.required and annotation != "Any":
+        annotation = f"Optional[{annotation}]"
+
+    # Defaults are always written out: pydantic treats a bare Any annotation
+    # as optional, unlike the (Any, ...) field SchemaReflector creates.
+    default = "..." if field.required else "None"
+    if attribute == name:
+        return f"    {attribute}: {annotation} = {default}"
+
+    return f"    {attribute}: {annotation} = Field({default}, alias={field.alias!r})"
+
+
+def _render_model(model: Type[BaseModel]) -> str:
+    lines = [f"class {model.__name__}(_ReflectedModel):"]
+    attributes: Dict[str, str] = {}
+    for name, field in model.__fields__.items():
+        attribute = _attribute_name(name)
+        existing = attributes.setdefault(attribute, name)
+        if existing != name:
+            raise ValueError(
+                f"Fields {existing!r} and {name!r} of {model.__name__} would both "
+                f"be generated as {attribute}"
+            )
+        lines.append(_render_field(name, attribute, field))
+    if len(lines) == 1:
+        lines.append("    pass")
+
+    return "\n".join(lines)
+
+
+def _collect_models(model: Type[BaseModel], models: Dict[str, Type[BaseModel]]):
+    for field in model.__fields__.values():
+        type_ = field.outer_type_
+        if isinstance(type_, type) and issubclass(type_, BaseModel):
+            _collect_models(type_, models)
+
+    if not _is_plain_name(model.__name__):
+        raise ValueError(f"Schema title {model.__name__!r} is not a valid class name")
+
+    existing = models.setdefault(model.__name__, model)
+    if existing is not model:
+        raise ValueError(f"Two different models are named {model.__name__}")
+
+
+def generate_module_source(schema: dict, detail_type: str) -> str:
+    """
+    Renders a Python module with static models equivalent to the ones
+    SchemaReflector builds for ``schema``. Importing the module registers the
+    root model, so ``reflect_event`` uses it for events of ``detail_type``.
+    """
+    reflector = SchemaReflector(schema)
+    root_model = reflector.create_model_for_jsonschema()
+
+    models: Dict[str, Type[BaseModel]] = {}
+    for definition in reflector.definitions.values():
+        _collect_models(definition, models)
+    _collect_models(root_model, models)
+
+    parts = [_MODULE_HEADER.format(detail_type=detail_type)]
+    parts.extend(_render_model(model) for model in models.values())
+    parts.append(
+        f"register_precompiled_model({detail_type!r}, {root_model.__name__})"
+    )
+    return "\n\n\n".join(parts) + "\n"
+
+
+def module_name_for(schema_name: str, schema_version: str) -> str:
+    return "{}_v{}".format(re.sub(r"\W", "_", schema_name).lower(), schema_version)
+
+
+def generate_modules(versions: Iterable, output_dir) -> List[Path]:
+    """
+    Writes one module per schema version into ``output_dir``, plus an
+    ``__init__.py`` that imports all of them.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    paths = []
+    module_names = []
+    for version in versions:
+        module_name = module_name_for(version.schema_name, version.schema_version)
+        path = output_dir / f"{module_name}.py"
+        path.write_text(
+            generate_module_source(version.content_dict, _detail_type_for(version))
+        )
+        paths.append(path)
+        module_names.append(module_name)
+
+    init_path = output_dir / "__init__.py"
+    init_path.write_text(
+        "".join(f"from . import {name}\n" for name in sorted(module_names))
+    )
+    paths.append(init_path)
+
+    return paths
+
+
+def load_registry_versions(
+    registry_name: str, prefix: Optional[str] = None, all_versions: bool = False
+) -> List:
+    registry = SchemaRegistry(registry_name, prefix=prefix)
+    registry.load_schemas()
+
+    versions = []
+    for schema in registry._schemas.values():
+        if all_versions:
+            versions.extend(schema._versions.values())
+        else:
+            versions.append(schema.get())
+
+    return versions
+
+
+def load_file_versions(path) -> List[_SchemaContentModel]:
+    """
+    Reads ``describe_schema`` responses, either a single object or a list of
+    them, from a JSON file.
+    """
+    with open(path) as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        data = [data]
+
+    return [_SchemaContentModel.parse_obj(item) for item in data]
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        prog="schema-registry-codegen",
+        description="Generate static pydantic models from registry schemas.",
+    )
+    parser.add_argument("output_dir", help="package directory to write modules to")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--registry", help="registry to load schemas from")
+    source.add_argument("--file", help="JSON file with describe_schema responses")
+    parser.add_argument("--prefix", help="only load schemas with this name prefix")
+    parser.add_argument(
+        "--all-versions",
+        action="store_true",
+        help="generate every version instead of only the latest",
+    )
+    args = parser.parse_args(argv)
+
+    if args.registry:
+        versions = load_registry_versions(
+            args.registry, prefix=args.prefix, all_versions=args.all_versions
+        )
+    else:
+        versions = load_file_versions(args.file)
+
+    for path in generate_modules(versions, args.output_dir):
+        print(path)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
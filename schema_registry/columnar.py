@@ -0,0 +1,180 @@
+from array import array
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Type, Union
+
+from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.errors import DictError, MissingError, NoneIsNotAllowedError
+from pydantic.validators import bool_validator, int_validator, str_validator
+
+from schema_registry.errors import InvalidEnvelopeError
+from schema_registry.reflection import model_for_detail_type
+
+# Fields of these types are decoded into typed arrays; everything else into lists.
+_ARRAY_TYPECODES = {int: "q", bool: "b"}
+
+_SCALAR_VALIDATORS = {
+    int: int_validator,
+    bool: bool_validator,
+    str: str_validator,
+    datetime: parse_datetime,
+}
+
+_MISSING = object()
+
+
+class ColumnarBatch:
+    """
+    Struct-of-arrays view of a batch of events that share a reflected model.
+
+    ``columns`` maps each field name to one value per row: an ``array`` for
+    integers and booleans, and a list for everything else. An integer column
+    becomes a list if a value does not fit in 64 bits. ``valid`` holds a
+    byte per row that is 0 where the field was missing, null or invalid; the
+    column then holds 0 or None for that row. ``errors`` maps row indexes to
+    the ValidationError raised for that row.
+    """
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        columns: Dict[str, Union[array, list]],
+        valid: Dict[str, bytearray],
+        errors: Dict[int, ValidationError],
+        size: int,
+    ):
+        self.model = model
+        self.columns = columns
+        self.valid = valid
+        self.errors = errors
+        self.size = size
+
+    def __getitem__(self, name) -> Union[array, list]:
+        return self.columns[name]
+
+    def __len__(self):
+        return self.size
+
+    def __repr__(self):
+        return f"ColumnarBatch<{self.model.__name__}, rows: {self.size}, errors: {len(self.errors)}>"
+
+
+def _field_validator(model: Type[BaseModel], field) -> Callable[[Any], Any]:
+    validator = _SCALAR_VALIDATORS.get(field.outer_type_)
+    if validator is not None:
+        return validator
+
+    def validate(value):
+        value, errors = field.validate(value, {}, loc=field.alias, cls=model)
+        if errors:
+            raise ValidationError([errors], model)
+        return value
+
+    return validate
+
+
+def _widen_column(columns, valid, entry) -> Callable[[Any], None]:
+    # A value didn't fit the typed array (e.g. an integer beyond int64), so the
+    # column becomes a list. Placeholders for invalid rows turn into None.
+    name = entry[0]
+    column = [
+        value if present else None
+        for value, present in zip(columns[name], valid[name])
+    ]
+    columns[name] = column
+    entry[3] = None
+    entry[5] = column.append
+    return column.append
+
+
+def decode_columnar(model: Type[BaseModel], details: Iterable[dict]) -> ColumnarBatch:
+    """
+    Validates a batch of event details against ``model`` field by field and
+    collects the values into columns, without creating a model per row.
+    """
+    plan = []
+    columns: Dict[str, Union[array, list]] = {}
+    valid: Dict[str, bytearray] = {}
+    for name, field in model.__fields__.items():
+        typecode = _ARRAY_TYPECODES.get(field.outer_type_)
+        columns[name] = array(typecode) if typecode else []
+        valid[name] = bytearray()
+        plan.append(
+            [
+                name,
+                field.alias,
+                field.required,
+                0 if typecode else None,
+                _field_validator(model, field),
+                columns[name].append,
+                valid[name].append,
+            ]
+        )
+
+    errors: Dict[int, ValidationError] = {}
+    size = 0
+    for row, detail in enumerate(details):
+        size += 1
+        row_errors: List[ErrorWrapper] = []
+
+        if not isinstance(detail, dict):
+            row_errors.append(ErrorWrapper(DictError(), loc="__root__"))
+            detail = {}
+
+        for entry in plan:
+            name, alias, required, placeholder, validate, append, append_valid = entry
+            value = detail.get(alias, _MISSING)
+            if value is _MISSING or value is None:
+                if required:
+                    error = MissingError() if value is _MISSING else NoneIsNotAllowedError()
+                    row_errors.append(ErrorWrapper(error, loc=alias))
+                append(placeholder)
+                append_valid(0)
+                continue
+
+            try:
+                value = validate(value)
+            except ValidationError as e:
+                row_errors.extend(e.raw_errors)
+            except (TypeError, ValueError, AssertionError) as e:
+                row_errors.append(ErrorWrapper(e, loc=alias))
+            else:
+                try:
+                    append(value)
+                except OverflowError:
+                    append = _widen_column(columns, valid, entry)
+                    append(value)
+                append_valid(1)
+                continue
+
+            append(placeholder)
+            append_valid(0)
+
+        if row_errors:
+            errors[row] = ValidationError(row_errors, model)
+
+    return ColumnarBatch(model, columns, valid, errors, size)
+
+
+def reflect_events_columnar(events: Sequence[dict], registry=None) -> ColumnarBatch:
+    """
+    Decodes a batch of events with the same detail type into columns. The
+    envelopes themselves are not validated.
+    """
+    detail_types = set()
+    for index, event in enumerate(events):
+        detail_type = event.get("detail-type") if isinstance(event, dict) else None
+        if not isinstance(detail_type, str):
+            raise InvalidEnvelopeError(f"Event {index} in the batch has no detail-type")
+        detail_types.add(detail_type)
+
+    if len(detail_types) != 1:
+        raise ValueError(
+            "Columnar decoding needs events of a single detail type, got {}".format(
+                ", ".join(sorted(detail_types)) or "none"
+            )
+        )
+
+    model = model_for_detail_type(detail_types.pop(), registry=registry)
+    return decode_columnar(model, (event.get("detail") for event in events))
@@ -0,0 +1,133 @@
+import json
+import re
+
+from json.decoder import scanstring
+from typing import Optional, Union
+
+from schema_registry.errors import InvalidEnvelopeError
+from schema_registry.models import Event
+from schema_registry.reflection import model_for_detail_type
+
+RawData = Union[bytes, bytearray, memoryview, str]
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"[ \t\n\r]*")
+
+
+def _as_text(data: RawData) -> str:
+    if isinstance(data, str):
+        return data
+
+    try:
+        return str(data, "utf-8")
+    except UnicodeDecodeError as e:
+        raise InvalidEnvelopeError("Event envelope is not valid UTF-8") from e
+
+
+def _peek_detail_type(text: str) -> str:
+    try:
+        return _scan_detail_type(text)
+    except json.JSONDecodeError as e:
+        raise InvalidEnvelopeError("Event envelope is not valid JSON") from e
+
+
+def _scan_detail_type(text: str) -> str:
+    # Walks the top level keys of the envelope and decodes only the values it
+    # has to step over. EventBridge puts "detail" last, so it is not decoded.
+    skip = _whitespace.match
+    idx = skip(text, 0).end()
+    if text[idx : idx + 1] != "{":
+        raise InvalidEnvelopeError("Event envelope is not a JSON object")
+
+    idx = skip(text, idx + 1).end()
+    while text[idx : idx + 1] == '"':
+        key, idx = scanstring(text, idx + 1)
+        idx = skip(text, idx).end()
+        if text[idx : idx + 1] != ":":
+            break
+
+        idx = skip(text, idx + 1).end()
+        value, idx = _decoder.raw_decode(text, idx)
+        if key == "detail-type":
+            if not isinstance(value, str):
+                break
+            return value
+
+        idx = skip(text, idx).end()
+        if text[idx : idx + 1] != ",":
+            break
+        idx = skip(text, idx + 1).end()
+
+    raise InvalidEnvelopeError("Event envelope has no detail-type")
+
+
+class RawEvent:
+    """
+    EventBridge envelope read straight from the bytes delivered by SQS or
+    Kinesis. ``detail_type`` is read without decoding the rest of the message,
+    the envelope is only decoded when ``detail`` is needed, and the ``Event``
+    model is only built when ``event`` is accessed.
+    """
+
+    __slots__ = ("_text", "_detail_type", "_envelope", "_event")
+
+    def __init__(self, data: RawData):
+        self._text = _as_text(data)
+        self._detail_type: Optional[str] = None
+        self._envelope: Optional[dict] = None
+        self._event: Optional[Event] = None
+
+    @property
+    def detail_type(self) -> str:
+        if self._detail_type is None:
+            if self._envelope is not None:
+                detail_type = self._envelope.get("detail-type")
+                if not isinstance(detail_type, str):
+                    raise InvalidEnvelopeError("Event envelope has no detail-type")
+                self._detail_type = detail_type
+            else:
+                self._detail_type = _peek_detail_type(self._text)
+
+        return self._detail_type
+
+    @property
+    def envelope(self) -> dict:
+        if self._envelope is None:
+            try:
+                envelope = json.loads(self._text)
+            except json.JSONDecodeError as e:
+                raise InvalidEnvelopeError("Event envelope is not valid JSON") from e
+            if not isinstance(envelope, dict):
+                raise InvalidEnvelopeError("Event envelope is not a JSON object")
+            self._envelope = envelope
+
+        return self._envelope
+
+    @property
+    def detail(self):
+        return self.envelope.get("detail")
+
+    @property
+    def event(self) -> Event:
+        if self._event is None:
+            self._event = Event.parse_obj(self.envelope)
+
+        return self._event
+
+    def reflect(self, registry=None, lazy: bool = False):
+        model = model_for_detail_type(self.detail_type, registry=registry)
+        if lazy:
+            return model.parse_lazy(self.detail)
+
+        return model.parse_obj(self.detail)
+
+    def __repr__(self):
+        try:
+            detail_type = self.detail_type
+        except InvalidEnvelopeError:
+            detail_type = "?"
+        return f"RawEvent<{detail_type}>"
+
+
+def reflect_raw_event(data: RawData, registry=None, lazy: bool = False):
+    return RawEvent(data).reflect(registry=registry, lazy=lazy)
@@ -5,3 +5,12 @@ class SchemaRegistryError(Exception):
 class ModelNotRegisteredError(SchemaRegistryError):
     def __init__(self, model):
         self.model = model
+
+
+class SchemaNotFoundError(SchemaRegistryError):
+    def __init__(self, schema_name):
+        self.schema_name = schema_name
+
+
+class InvalidEnvelopeError(SchemaRegistryError):
+    pass
@@ -0,0 +1,126 @@
+import logging
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple, Union
+
+from schema_registry.client import SchemaRegistry, Schema, _restore_registry
+from schema_registry.errors import SchemaNotFoundError
+
+logger = logging.getLogger("schema_registry")
+
+
+class RegistrySource(NamedTuple):
+    region: str
+    registry_name: str
+
+
+class FederatedSchemaRegistry:
+    """
+    Resolves schemas across an ordered list of registries, possibly in
+    different regions. Every source is queried in parallel and the hit from the
+    earliest source in the list wins. The owning source of each schema name is
+    remembered, so later lookups only query that source.
+
+    Lookups that name a registry, like the ones for an event's detail type,
+    only query the sources with that registry name. The region of a
+    ``(region, registry)`` source always comes from the source, so
+    ``region_name`` can't be passed as a boto option.
+    """
+
+    def __init__(
+        self,
+        sources: Iterable[Union[RegistrySource, tuple, SchemaRegistry]],
+        *,
+        max_workers: Optional[int] = None,
+        **boto_opts,
+    ):
+        if "region_name" in boto_opts:
+            raise TypeError(
+                "region_name is taken from each (region, registry) source and "
+                "can't be passed as a boto option"
+            )
+
+        self.registries: List[SchemaRegistry] = []
+        for source in sources:
+            if isinstance(source, tuple):
+                source = RegistrySource(*source)
+                source = SchemaRegistry(
+                    source.registry_name, region_name=source.region, **boto_opts
+                )
+            self.registries.append(source)
+
+        if not self.registries:
+            raise ValueError("At least one registry source is required")
+
+        self._max_workers = max_workers
+        self._owners: Dict[Tuple[Optional[str], str], SchemaRegistry] = {}
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(self.registries),
+            thread_name_prefix="schema_registry",
+        )
+
+    def __reduce__(self):
+        args = (tuple(self.registries),)
+        kwargs = {"max_workers": self._max_workers}
+        return _restore_registry, (FederatedSchemaRegistry, args, kwargs)
+
+    def owner_of(
+        self, name, registry_name: Optional[str] = None
+    ) -> Optional[SchemaRegistry]:
+        return self._owners.get((registry_name, name))
+
+    def find_schema(
+        self, name, registry_name: Optional[str] = None
+    ) -> Optional[Schema]:
+        key = (registry_name, name)
+        owner = self._owners.get(key)
+        if owner is not None:
+            schema = owner.find_schema(name)
+            if schema is not None:
+                return schema
+
+            logger.debug("Schema %s moved away from %s", name, owner.registry_name)
+            del self._owners[key]
+
+        registries = self.registries
+        if registry_name is not None:
+            registries = [r for r in registries if r.registry_name == registry_name]
+
+        futures = [
+            self._executor.submit(registry.find_schema, name) for registry in registries
+        ]
+
+        # Sources are authoritative in list order, so a hit is only returned
+        # once every source before it has answered that it does not know the
+        # schema. Errors from those sources are raised rather than skipped.
+        try:
+            for registry, future in zip(registries, futures):
+                schema = future.result()
+                if schema is not None:
+                    self._owners[key] = registry
+                    return schema
+        finally:
+            for future in futures:
+                future.cancel()
+
+        return None
+
+    def get_schema(self, name, registry_name: Optional[str] = None) -> Schema:
+        schema = self.find_schema(name, registry_name=registry_name)
+        if schema is None:
+            raise SchemaNotFoundError(name)
+
+        return schema
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        sources = ", ".join(registry.registry_name for registry in self.registries)
+        return f"FederatedSchemaRegistry<{sources}>"
@@ -6,6 +6,7 @@ from pydantic import create_model, BaseModel, Field, PrivateAttr, Json
 from .utils import camel_generator
 
 import json
+import zlib
 
 
 class _AWSResponseModel(BaseModel):
@@ -43,6 +44,82 @@ class _SchemaContentModel(_SchemaCreateUpdateModel):
         return self._content
 
 
+class _SchemaVersionRecord:
+    """
+    Compact stand-in for _SchemaContentModel, used to keep every version of a
+    schema in memory. Content is stored zlib compressed and parsed into a new
+    dict on every access, so no parsed copy is retained. ``dict()`` and
+    ``json()`` go through an equivalent _SchemaContentModel.
+    """
+
+    __slots__ = (
+        "last_modified",
+        "schema_arn",
+        "schema_name",
+        "tags",
+        "version_count",
+        "schema_version",
+        "type_",
+        "description",
+        "version_created_date",
+        "_compressed_content",
+    )
+
+    def __init__(
+        self,
+        *,
+        schema_arn: str,
+        schema_name: str,
+        schema_version: str,
+        type_: str,
+        version_created_date: datetime,
+        content: str,
+        description: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+        tags: Optional[Dict[str, str]] = None,
+        version_count: int = 1,
+    ):
+        self.schema_arn = schema_arn
+        self.schema_name = schema_name
+        self.schema_version = schema_version
+        self.type_ = type_
+        self.version_created_date = version_created_date
+        self.description = description
+        self.last_modified = last_modified
+        self.tags = tags
+        self.version_count = version_count
+        self._compressed_content = zlib.compress(content.encode())
+
+    @classmethod
+    def from_content_model(cls, model: _SchemaContentModel) -> "_SchemaVersionRecord":
+        return cls(**model.dict())
+
+    @property
+    def content(self) -> str:
+        return zlib.decompress(self._compressed_content).decode()
+
+    @property
+    def content_dict(self) -> dict:
+        return json.loads(zlib.decompress(self._compressed_content))
+
+    def to_content_model(self) -> _SchemaContentModel:
+        values = {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if not name.startswith("_")
+        }
+        return _SchemaContentModel.construct(content=self.content, **values)
+
+    def dict(self, **kwargs) -> dict:
+        return self.to_content_model().dict(**kwargs)
+
+    def json(self, **kwargs) -> str:
+        return self.to_content_model().json(**kwargs)
+
+    def __repr__(self):
+        return f"_SchemaVersionRecord<{self.schema_name}, version: {self.schema_version}>"
+
+
 class _SchemaVersionsPageModel(_AWSResponseModel):
     schema_versions: List[_SchemaVersionModel]
 
@@ -0,0 +1,61 @@
+import os
+
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+from schema_registry.reflection import reflect_event
+
+
+def _reflect_batch(events: List[dict], registry=None) -> List[BaseModel]:
+    return [reflect_event(event, registry=registry) for event in events]
+
+
+def _batches(events: Iterable[dict], batch_size: int) -> Iterator[List[dict]]:
+    iterator = iter(events)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def reflect_events(
+    events: Iterable[dict],
+    *,
+    registry=None,
+    executor: Optional[Executor] = None,
+    max_workers: Optional[int] = None,
+    batch_size: int = 256,
+) -> Iterator[BaseModel]:
+    """
+    Reflects events in batches on a process pool, yielding the decoded models
+    in input order. Each worker process reflects a schema once and reuses it
+    for every later event with the same detail type. At most two batches per
+    worker are in flight, so ``events`` is consumed as results are yielded.
+
+    ``registry`` (e.g. a FederatedSchemaRegistry) is pickled to the workers,
+    which rebuild it once per process and resolve schemas through it.
+    """
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    window = 2 * (max_workers or os.cpu_count() or 1)
+    pending: Deque[Future] = deque()
+    try:
+        for batch in _batches(events, batch_size):
+            if len(pending) >= window:
+                yield from pending.popleft().result()
+            pending.append(executor.submit(_reflect_batch, batch, registry))
+
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if owns_executor:
+            executor.shutdown()
@@ -1,33 +1,134 @@
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Type
 from datetime import datetime
 
+import copyreg
+import json
+import re
+import weakref
+
 from pydantic import BaseModel, create_model, Field, PrivateAttr
+from pydantic.error_wrappers import ErrorWrapper, ValidationError
+from pydantic.errors import MissingError
+from pydantic.main import ModelMetaclass
 from devtools import debug
 from jsonpointer import resolve_pointer
 
 from schema_registry.models import Event
 from schema_registry.client import SchemaRegistry
+from schema_registry.errors import InvalidEnvelopeError
+from schema_registry.federation import FederatedSchemaRegistry
+
+# <registry name>/<schema name>:<version>
+_DETAIL_TYPE = re.compile(r"([^/]+)/([^:]+):([^:]+)")
+
+# Per-process cache of models reflected from registry schemas, keyed by the
+# detail type their instances are pickled with.
+_reflected_models: Dict[str, Type[BaseModel]] = {}
 
+# Models rebuilt from a pickled schema. Entries go away with their model.
+_schema_models: "weakref.WeakValueDictionary[str, Type[BaseModel]]" = (
+    weakref.WeakValueDictionary()
+)
 
-def reflect_event(event_dict: dict) -> BaseModel:
+
+def reflect_event(event_dict: dict, registry=None, lazy: bool = False):
     event: Event = Event.parse_obj(event_dict)
 
-    registry: SchemaRegistry = SchemaRegistry(event.schema_registry)
-    schema = registry.get_schema(event.schema_name)
-    version = schema.get(version=event.schema_version)
+    model = model_for_detail_type(event.detail_type, registry=registry)
+    if lazy:
+        return model.parse_lazy(event_dict.get("detail"))
+
+    return model.parse_obj(event_dict.get("detail"))
+
+
+def model_for_detail_type(detail_type: str, registry=None) -> Type[BaseModel]:
+    if detail_type in _reflected_models:
+        return _reflected_models[detail_type]
+
+    match = _DETAIL_TYPE.fullmatch(detail_type)
+    if match is None:
+        raise InvalidEnvelopeError(
+            f"Detail type {detail_type!r} is not of the form registry/schema:version"
+        )
+    registry_name, schema_name, schema_version = match.groups()
+
+    if registry is None:
+        registry = SchemaRegistry(registry_name)
+
+    if isinstance(registry, FederatedSchemaRegistry):
+        # Several sources can hold a schema of the same name, so only the ones
+        # for the registry named in the detail type are asked.
+        schema = registry.get_schema(schema_name, registry_name=registry_name)
+    else:
+        schema = registry.get_schema(schema_name)
+    version = schema.get(version=schema_version)
     reflector = SchemaReflector(version.content_dict)
     model = reflector.create_model_for_jsonschema()
-    setattr(model, "__detail_type__", event_dict.get("detail-type"))
-    return model.parse_obj(event_dict.get("detail"))
+    setattr(model, "__detail_type__", detail_type)
+    setattr(model, "__schema_ref__", detail_type)
+    setattr(model, "__registry__", registry)
+
+    _reflected_models[detail_type] = model
+    return model
+
+
+def register_precompiled_model(detail_type: str, model: Type[BaseModel]):
+    setattr(model, "__detail_type__", detail_type)
+    _reflected_models[detail_type] = model
+
+
+def _load_schema_model(content: str) -> Type[BaseModel]:
+    model = _schema_models.get(content)
+    if model is None:
+        model = SchemaReflector(json.loads(content)).create_model_for_jsonschema()
+        _schema_models[content] = model
+
+    return model
+
+
+class _ReflectedModelMetaclass(ModelMetaclass):
+    pass
+
 
+def _reduce_reflected_model(model: Type[BaseModel]):
+    # Models created at runtime can't be found by import, so they are pickled
+    # as a reference to the schema they were reflected from: the detail type
+    # and the registry it was loaded through for registry schemas, the schema
+    # itself otherwise. Everything else (e.g. BaseEvent subclasses) is pickled
+    # by name as usual.
+    detail_type = model.__dict__.get("__schema_ref__")
+    if detail_type is not None:
+        return model_for_detail_type, (detail_type, model.__dict__.get("__registry__"))
 
-class _ReflectedModel(BaseModel):
+    schema = model.__dict__.get("__reflected_schema__")
+    if schema is None:
+        return model.__qualname__
+
+    content = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    _schema_models.setdefault(content, model)
+    return _load_schema_model, (content,)
+
+
+copyreg.pickle(_ReflectedModelMetaclass, _reduce_reflected_model)
+
+
+class _ReflectedModel(BaseModel, metaclass=_ReflectedModelMetaclass):
     __detail_type__: str = PrivateAttr()
 
     @property
     def detail_type(self) -> Optional[str]:
         return self.__detail_type__ or None
 
+    @classmethod
+    def parse_lazy(cls, obj: dict) -> "LazyModel":
+        return LazyModel(cls, obj)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # The detail type lives on the reflected class, not on its instances.
+        state["__private_attribute_values__"].pop("__detail_type__", None)
+        return state
+
     class Config:
         alias_generator = lambda x: "fields_" if x == "fields" else x
 
@@ -35,6 +136,64 @@ class _ReflectedModel(BaseModel):
 BaseEvent = _ReflectedModel
 
 
+class LazyModel:
+    """
+    Wraps the raw data for a reflected model and validates each field the
+    first time it is read, keeping the result. Fields that are never read are
+    never validated; ``validate()`` validates everything and returns the model.
+    """
+
+    def __init__(self, model: Type[BaseModel], data: dict):
+        self._lazy_model = model
+        self._lazy_data = data
+        self._lazy_instance: Optional[BaseModel] = None
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        model = self._lazy_model
+        try:
+            field = model.__fields__[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{model.__name__}' object has no attribute '{name}'"
+            ) from None
+
+        if field.alias in self._lazy_data:
+            value, errors = field.validate(
+                self._lazy_data[field.alias], {}, loc=field.alias, cls=model
+            )
+            if errors:
+                raise ValidationError([errors], model)
+        elif field.required:
+            raise ValidationError([ErrorWrapper(MissingError(), loc=field.alias)], model)
+        else:
+            value = field.get_default()
+
+        # Later reads find the value in __dict__ and skip __getattr__ entirely.
+        self.__dict__[name] = value
+        return value
+
+    @property
+    def detail_type(self) -> Optional[str]:
+        # Unset private attributes show up on the class as slot descriptors.
+        detail_type = getattr(self._lazy_model, "__detail_type__", None)
+        return detail_type if isinstance(detail_type, str) else None
+
+    def validate(self) -> BaseModel:
+        if self._lazy_instance is None:
+            self._lazy_instance = self._lazy_model.parse_obj(self._lazy_data)
+
+        return self._lazy_instance
+
+    def __reduce__(self):
+        return LazyModel, (self._lazy_model, self._lazy_data)
+
+    def __repr__(self):
+        return f"Lazy{self._lazy_model.__name__}({self._lazy_data!r})"
+
+
 class SchemaReflector:
     def __init__(self, schema, registry=None):
         self.schema = schema
@@ -127,6 +286,8 @@ class SchemaReflector:
 
         self._resolve_properties()
 
-        return create_model(
+        model = create_model(
             self.root_model_name, __base__=_ReflectedModel, **self.fields
         )
+        setattr(model, "__reflected_schema__", self.schema)
+        return model
@@ -0,0 +1,73 @@
+import sys
+
+from types import SimpleNamespace
+from typing import Dict, List
+
+import pytest
+
+from schema_registry import reflection
+
+
+class FakeSchema:
+    def __init__(self, content: dict):
+        self.content = content
+
+    def get(self, version=None):
+        return SimpleNamespace(content_dict=self.content)
+
+
+class FakeRegistry:
+    """
+    Stands in for SchemaRegistry with schema content held in memory. It is
+    defined at module level so it can be pickled to pool workers. Lookups are
+    recorded in ``lookups``; when ``gate`` is set, each lookup waits on it.
+    """
+
+    def __init__(
+        self, schemas: Dict[str, dict], registry_name: str = "TAPI-TEST", gate=None
+    ):
+        self.registry_name = registry_name
+        self.schemas = schemas
+        self.gate = gate
+        self.lookups: List[str] = []
+
+    def __getstate__(self):
+        # Locks and barriers can't be pickled and are no use in other processes.
+        return dict(self.__dict__, gate=None)
+
+    def find_schema(self, name):
+        self.lookups.append(name)
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+
+        if name not in self.schemas:
+            return None
+
+        return FakeSchema(self.schemas[name])
+
+    def get_schema(self, name):
+        self.lookups.append(name)
+        return FakeSchema(self.schemas[name])
+
+
+@pytest.fixture(scope="session")
+def fake_registry_factory():
+    yield FakeRegistry
+
+
+@pytest.fixture(autouse=True)
+def restore_reflected_models():
+    reflected_models = dict(reflection._reflected_models)
+    yield
+    reflection._reflected_models.clear()
+    reflection._reflected_models.update(reflected_models)
+
+
+@pytest.fixture()
+def restore_imports():
+    path = list(sys.path)
+    modules = set(sys.modules)
+    yield
+    sys.path[:] = path
+    for name in set(sys.modules) - modules:
+        del sys.modules[name]
@@ -0,0 +1,176 @@
+import importlib
+import json
+import pickle
+import sys
+
+import pytest
+
+from pydantic import ValidationError
+
+from schema_registry.codegen import (
+    generate_module_source,
+    generate_modules,
+    load_file_versions,
+    main,
+)
+from schema_registry.reflection import SchemaReflector, model_for_detail_type
+
+DETAIL_TYPE = "TAPI-TEST/schema_registry.test.GeneratedModel:2"
+
+
+@pytest.fixture(scope="module")
+def generated_schema():
+    item = {
+        "title": "GeneratedModel",
+        "type": "object",
+        "properties": {
+            "name": {"title": "Name", "type": "string"},
+            "class": {"title": "Class", "type": "string"},
+            "timestamp": {"title": "Timestamp", "type": "string", "format": "date-time"},
+            "group": {"$ref": "#/definitions/GeneratedGroup"},
+        },
+        "required": ["name", "group"],
+        "definitions": {
+            "GeneratedGroup": {
+                "title": "GeneratedGroup",
+                "type": "object",
+                "properties": {"id": {"title": "Id", "type": "integer"}},
+                "required": ["id"],
+            }
+        },
+    }
+    yield item
+
+
+@pytest.fixture(scope="module")
+def complex_model_blank_array_schema():
+    item = {
+        "title": "ComplexModel",
+        "type": "object",
+        "properties": {
+            "name": {"title": "Name", "type": "string"},
+            "groups": {"title": "Groups", "type": "array", "items": {}},
+        },
+        "required": ["name", "groups"],
+    }
+    yield item
+
+
+@pytest.fixture(scope="module")
+def schema_file(generated_schema, tmp_path_factory):
+    path = tmp_path_factory.mktemp("schemas") / "schemas.json"
+    response = {
+        "SchemaArn": "arn:aws:schemas:eu-west-1:740218546536:schema/TAPI-TEST/schema_registry.test.GeneratedModel",
+        "SchemaName": "schema_registry.test.GeneratedModel",
+        "SchemaVersion": "2",
+        "Type": "JSONSchemaDraft4",
+        "VersionCreatedDate": "2020-11-27T16:53:00Z",
+        "Content": json.dumps(generated_schema),
+    }
+    path.write_text(json.dumps([response]))
+    yield path
+
+
+@pytest.fixture()
+def generated_package(schema_file, tmp_path, restore_imports):
+    main([str(tmp_path / "generated_models"), "--file", str(schema_file)])
+
+    sys.path.insert(0, str(tmp_path))
+    yield importlib.import_module("generated_models")
+
+
+def test_generated_module_is_registered(generated_package):
+    module = generated_package.schema_registry_test_generatedmodel_v2
+    assert model_for_detail_type(DETAIL_TYPE) is module.GeneratedModel
+
+
+def test_generated_model_matches_reflection(generated_package, generated_schema):
+    static_model = generated_package.schema_registry_test_generatedmodel_v2.GeneratedModel
+    reflected_model = SchemaReflector(generated_schema).create_model_for_jsonschema()
+    data = {
+        "name": "ozzeh",
+        "class": "Pilot",
+        "timestamp": "2020-11-27T16:53:00Z",
+        "group": {"id": "1"},
+    }
+
+    static = static_model.parse_obj(data)
+    reflected = reflected_model.parse_obj(data)
+    assert static.dict(by_alias=True) == reflected.dict(by_alias=True)
+    assert static.detail_type == DETAIL_TYPE
+    assert pickle.loads(pickle.dumps(static)) == static
+
+
+def test_generated_modules_are_stable(schema_file, tmp_path):
+    versions = load_file_versions(schema_file)
+    first = [p.read_text() for p in generate_modules(versions, tmp_path / "a")]
+    second = [p.read_text() for p in generate_modules(versions, tmp_path / "b")]
+    assert first == second
+
+
+def test_required_untyped_array(complex_model_blank_array_schema):
+    source = generate_module_source(
+        complex_model_blank_array_schema, "TAPI-TEST/schema_registry.test.BlankArray:1"
+    )
+    namespace = {"__name__": "generated_blank_array"}
+    exec(compile(source, "generated_blank_array.py", "exec"), namespace)
+
+    static_model = namespace["ComplexModel"]
+    reflected_model = SchemaReflector(
+        complex_model_blank_array_schema
+    ).create_model_for_jsonschema()
+
+    assert static_model.__fields__["groups"].required
+    for model in (static_model, reflected_model):
+        with pytest.raises(ValidationError):
+            model.parse_obj({"name": "a"})
+        assert model.parse_obj({"name": "a", "groups": [1]}).groups == [1]
+
+
+def test_field_names_are_valid_identifiers():
+    schema = {
+        "title": "OddNamesModel",
+        "type": "object",
+        "properties": {
+            "1st": {"title": "1st", "type": "string"},
+            "first-name": {"title": "First Name", "type": "string"},
+            "datetime": {"title": "Datetime", "type": "string", "format": "date-time"},
+        },
+        "required": ["1st"],
+    }
+    source = generate_module_source(schema, "TAPI-TEST/schema_registry.test.OddNames:1")
+    namespace = {"__name__": "generated_odd_names"}
+    exec(compile(source, "generated_odd_names.py", "exec"), namespace)
+
+    model = namespace["OddNamesModel"].parse_obj(
+        {"1st": "a", "first-name": "b", "datetime": "2020-11-27T16:53:00Z"}
+    )
+    assert model.field_1st_ == "a"
+    assert model.first_name_ == "b"
+    assert model.datetime_.year == 2020
+
+
+def test_clashing_field_names():
+    schema = {
+        "title": "ClashModel",
+        "type": "object",
+        "properties": {
+            "class": {"title": "Class", "type": "string"},
+            "class_": {"title": "Class", "type": "string"},
+        },
+        "required": [],
+    }
+    with pytest.raises(ValueError, match="class_"):
+        generate_module_source(schema, "TAPI-TEST/schema_registry.test.Clash:1")
+
+
+@pytest.mark.parametrize("title", ["My Model", "class", "Field"])
+def test_invalid_class_names(title):
+    schema = {
+        "title": title,
+        "type": "object",
+        "properties": {"name": {"title": "Name", "type": "string"}},
+        "required": [],
+    }
+    with pytest.raises(ValueError, match="not a valid class name"):
+        generate_module_source(schema, "TAPI-TEST/schema_registry.test.Invalid:1")
@@ -0,0 +1,124 @@
+from array import array
+from datetime import datetime, timezone
+
+import pytest
+
+from schema_registry import decode_columnar, reflect_events_columnar
+from schema_registry.errors import InvalidEnvelopeError
+from schema_registry.reflection import SchemaReflector
+
+
+@pytest.fixture(scope="module")
+def columnar_schema():
+    item = {
+        "title": "ColumnarModel",
+        "type": "object",
+        "properties": {
+            "name": {"title": "Name", "type": "string"},
+            "count": {"title": "Count", "type": "integer"},
+            "is_read": {"title": "Is Read", "type": "boolean"},
+            "timestamp": {"title": "Timestamp", "type": "string", "format": "date-time"},
+            "group": {"$ref": "#/definitions/ColumnarGroup"},
+        },
+        "required": ["name", "count"],
+        "definitions": {
+            "ColumnarGroup": {
+                "title": "ColumnarGroup",
+                "type": "object",
+                "properties": {"id": {"title": "Id", "type": "integer"}},
+                "required": ["id"],
+            }
+        },
+    }
+    yield item
+
+
+@pytest.fixture(scope="module")
+def columnar_model(columnar_schema):
+    yield SchemaReflector(columnar_schema).create_model_for_jsonschema()
+
+
+def test_decode_columnar(columnar_model):
+    details = [
+        {"name": "a", "count": 1, "is_read": True, "timestamp": "2020-11-27T16:53:00Z"},
+        {"name": "b", "count": "2", "group": {"id": 3}},
+    ]
+    batch = decode_columnar(columnar_model, details)
+
+    assert len(batch) == 2
+    assert not batch.errors
+    assert batch["name"] == ["a", "b"]
+    assert batch["count"] == array("q", [1, 2])
+    assert batch["is_read"] == array("b", [True, False])
+    assert batch.valid["is_read"] == bytearray([1, 0])
+    assert batch["timestamp"] == [datetime(2020, 11, 27, 16, 53, tzinfo=timezone.utc), None]
+    assert batch["group"][1].id == 3
+
+
+def test_decode_columnar_errors(columnar_model):
+    details = [
+        {"name": "a", "count": "many"},
+        {"count": 2, "group": {"id": "x"}},
+        None,
+        {"name": "d", "count": 4},
+    ]
+    batch = decode_columnar(columnar_model, details)
+
+    assert sorted(batch.errors) == [0, 1, 2]
+    assert [e["loc"] for e in batch.errors[1].errors()] == [("name",), ("group", "id")]
+    assert batch["count"] == array("q", [0, 2, 0, 4])
+    assert batch.valid["count"] == bytearray([0, 1, 0, 1])
+    assert all(len(column) == 4 for column in batch.columns.values())
+
+
+def test_matches_reflection(columnar_model):
+    details = [{"name": "a", "count": "5", "is_read": "yes"}]
+    batch = decode_columnar(columnar_model, details)
+    model = columnar_model.parse_obj(details[0])
+
+    assert batch["count"][0] == model.count
+    assert bool(batch["is_read"][0]) == model.is_read
+
+
+def test_mixed_detail_types():
+    events = [{"detail-type": "A/a:1", "detail": {}}, {"detail-type": "A/b:1", "detail": {}}]
+    with pytest.raises(ValueError):
+        reflect_events_columnar(events)
+
+
+def test_integer_overflow_widens_column(columnar_model):
+    details = [
+        {"name": "a", "count": "x"},
+        {"name": "b", "count": 2 ** 64},
+        {"name": "c", "count": 3},
+    ]
+    batch = decode_columnar(columnar_model, details)
+
+    assert columnar_model.parse_obj(details[1]).count == 2 ** 64
+    assert sorted(batch.errors) == [0]
+    assert batch["count"] == [None, 2 ** 64, 3]
+    assert batch.valid["count"] == bytearray([0, 1, 1])
+
+
+def test_missing_detail_type():
+    with pytest.raises(InvalidEnvelopeError):
+        reflect_events_columnar([{"detail": {}}])
+
+
+def test_reflect_events_columnar(columnar_schema, fake_registry_factory):
+    registry = fake_registry_factory({"schema_registry.test.ColumnarModel": columnar_schema})
+    detail_type = "TAPI-TEST/schema_registry.test.ColumnarModel:1"
+    events = [
+        {"detail-type": detail_type, "detail": {"name": "a", "count": 1}},
+        {"detail-type": detail_type, "detail": {"name": "b", "count": "x"}},
+        {"detail-type": detail_type, "detail": {"name": "c", "count": 3, "is_read": True}},
+    ]
+    batch = reflect_events_columnar(events, registry=registry)
+
+    assert registry.lookups == ["schema_registry.test.ColumnarModel"]
+    assert batch.model.__detail_type__ == detail_type
+    assert len(batch) == 3
+    assert sorted(batch.errors) == [1]
+    assert batch["name"] == ["a", "b", "c"]
+    assert batch["count"] == array("q", [1, 0, 3])
+    assert batch.valid["is_read"] == bytearray([0, 0, 1])
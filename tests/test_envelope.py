@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from schema_registry import Event
+from schema_registry.envelope import RawEvent, reflect_raw_event
+from schema_registry.errors import InvalidEnvelopeError
+
+DETAIL_TYPE = "TAPI-TEST/schema_registry.test.EnvelopeModel:1"
+
+
+@pytest.fixture(scope="module")
+def fake_registry(fake_registry_factory):
+    schema = {
+        "title": "EnvelopeModel",
+        "type": "object",
+        "properties": {"name": {"title": "Name", "type": "string"}},
+        "required": ["name"],
+    }
+    yield fake_registry_factory({"schema_registry.test.EnvelopeModel": schema})
+
+
+@pytest.fixture(scope="module")
+def event_bytes():
+    event = {
+        "version": "0",
+        "id": "d944d595-b186-4b86-43fe-b096d7e13bb3",
+        "detail-type": DETAIL_TYPE,
+        "source": "com.pleaseignore.tvm.test",
+        "account": "740218546536",
+        "time": "2020-11-27T16:53:00Z",
+        "region": "eu-west-1",
+        "resources": ["pydantic-schema-registry"],
+        "detail": {"name": "ozzeh"},
+    }
+    yield json.dumps(event, indent=2).encode()
+
+
+def test_detail_type_without_decoding_detail():
+    data = b'{"id": "1", "detail-type": "A/b.C:1", "detail": {not json'
+    assert RawEvent(memoryview(data)).detail_type == "A/b.C:1"
+
+
+def test_missing_detail_type():
+    with pytest.raises(InvalidEnvelopeError):
+        RawEvent(b'{"id": "1", "detail": {}}').detail_type
+    with pytest.raises(InvalidEnvelopeError):
+        RawEvent(b"[]").detail_type
+
+
+def test_event_is_materialized_on_request(event_bytes):
+    raw = RawEvent(bytearray(event_bytes))
+    assert raw.detail == {"name": "ozzeh"}
+    assert raw._event is None
+    assert raw.event == Event.parse_raw(event_bytes)
+
+
+def test_reflect_raw_event(event_bytes, fake_registry):
+    model = reflect_raw_event(event_bytes, registry=fake_registry)
+    assert model.name == "ozzeh"
+    assert model.detail_type == DETAIL_TYPE
+
+    lazy = reflect_raw_event(event_bytes, registry=fake_registry, lazy=True)
+    assert lazy.name == "ozzeh"
+
+
+def test_missing_detail_type_after_decoding():
+    raw = RawEvent(b'{"id": "1", "detail": {}}')
+    assert raw.detail == {}
+    with pytest.raises(InvalidEnvelopeError):
+        raw.detail_type
+
+
+def test_undecodable_envelopes():
+    with pytest.raises(InvalidEnvelopeError):
+        RawEvent(b'{"detail-type": "\xff"}')
+    with pytest.raises(InvalidEnvelopeError):
+        RawEvent(b'{"id": ').detail_type
+    with pytest.raises(InvalidEnvelopeError):
+        RawEvent(b'{"id": ').detail
+
+
+@pytest.mark.parametrize("detail_type", ["nodelimiter", "R/name", "R/name:1:2", "/name:1"])
+def test_malformed_detail_type(detail_type, fake_registry):
+    raw = RawEvent(json.dumps({"detail-type": detail_type, "detail": {}}))
+    lookups = len(fake_registry.lookups)
+    with pytest.raises(InvalidEnvelopeError):
+        raw.reflect(registry=fake_registry)
+    assert len(fake_registry.lookups) == lookups
+
+
+def test_repr_does_not_raise():
+    assert repr(RawEvent(b"[]")) == "RawEvent<?>"
+    assert repr(RawEvent(b'{"detail-type": "A/b.C:1"}')) == "RawEvent<A/b.C:1>"
@@ -0,0 +1,167 @@
+import multiprocessing
+import pickle
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from schema_registry import (
+    FederatedSchemaRegistry,
+    SchemaNotFoundError,
+    SchemaRegistry,
+    reflect_event,
+)
+from schema_registry.parallel import reflect_events
+
+
+@pytest.fixture()
+def registries(fake_registry_factory):
+    yield [
+        fake_registry_factory({"a": {"title": "eu-a"}}, registry_name="eu-west-1"),
+        fake_registry_factory(
+            {"a": {"title": "us-a"}, "b": {"title": "us-b"}}, registry_name="us-east-1"
+        ),
+        fake_registry_factory(
+            {"c": {"title": "discovered-c"}}, registry_name="discovered-schemas"
+        ),
+    ]
+
+
+def test_first_source_wins(registries):
+    with FederatedSchemaRegistry(registries) as federated:
+        assert federated.get_schema("a").content == {"title": "eu-a"}
+        assert federated.get_schema("b").content == {"title": "us-b"}
+        assert federated.owner_of("b") is registries[1]
+
+
+def test_fan_out_is_parallel(registries):
+    gate = threading.Barrier(len(registries))
+    for registry in registries:
+        registry.gate = gate
+
+    with FederatedSchemaRegistry(registries) as federated:
+        assert federated.get_schema("c").content == {"title": "discovered-c"}
+
+
+def test_owner_is_remembered(registries):
+    with FederatedSchemaRegistry(registries) as federated:
+        federated.get_schema("c")
+        federated.get_schema("c")
+
+    assert registries[0].lookups == ["c"]
+    assert registries[2].lookups == ["c", "c"]
+
+
+def test_lookup_by_registry_name(registries):
+    with FederatedSchemaRegistry(registries) as federated:
+        schema = federated.get_schema("a", registry_name="us-east-1")
+        assert schema.content == {"title": "us-a"}
+        assert federated.owner_of("a", registry_name="us-east-1") is registries[1]
+        assert federated.owner_of("a") is None
+
+        with pytest.raises(SchemaNotFoundError):
+            federated.get_schema("c", registry_name="eu-west-1")
+
+    assert registries[2].lookups == []
+
+
+def test_region_name_is_rejected():
+    with pytest.raises(TypeError):
+        FederatedSchemaRegistry([("eu-west-1", "TAPI-TEST")], region_name="us-east-1")
+
+
+def test_schema_not_found(registries):
+    with FederatedSchemaRegistry(registries) as federated:
+        with pytest.raises(SchemaNotFoundError):
+            federated.get_schema("missing")
+        assert federated.owner_of("missing") is None
+
+
+@pytest.fixture()
+def federated_event():
+    yield {
+        "version": "0",
+        "id": "d944d595-b186-4b86-43fe-b096d7e13bb3",
+        "detail-type": "TAPI-TEST/schema_registry.test.FederatedModel:1",
+        "source": "com.pleaseignore.tvm.test",
+        "account": "740218546536",
+        "time": "2020-11-27T16:53:00Z",
+        "region": "eu-west-1",
+        "resources": ["pydantic-schema-registry"],
+        "detail": {"name": "ozzeh"},
+    }
+
+
+@pytest.fixture()
+def federated_registries(fake_registry_factory):
+    schema = {
+        "title": "FederatedModel",
+        "type": "object",
+        "properties": {"name": {"title": "Name", "type": "string"}},
+        "required": ["name"],
+    }
+    yield [
+        fake_registry_factory({}, registry_name="eu-west-1"),
+        fake_registry_factory({"schema_registry.test.FederatedModel": schema}),
+    ]
+
+
+def test_reflect_event_through_federation(federated_registries, federated_event):
+    with FederatedSchemaRegistry(federated_registries) as federated:
+        model = reflect_event(federated_event, registry=federated)
+
+        assert model.name == "ozzeh"
+        owner = federated.owner_of(
+            "schema_registry.test.FederatedModel", registry_name="TAPI-TEST"
+        )
+        assert owner is federated_registries[1]
+        assert type(model).__registry__ is federated
+
+
+def test_reflect_event_uses_detail_type_registry(fake_registry_factory, federated_event):
+    def schema(field):
+        return {
+            "title": "FederatedModel",
+            "type": "object",
+            "properties": {field: {"title": field, "type": "string"}},
+            "required": [field],
+        }
+
+    sources = [
+        fake_registry_factory({"s.X": schema("a")}, registry_name="A"),
+        fake_registry_factory({"s.X": schema("name")}, registry_name="B"),
+    ]
+    federated_event["detail-type"] = "B/s.X:1"
+
+    with FederatedSchemaRegistry(sources) as federated:
+        model = reflect_event(federated_event, registry=federated)
+
+    assert model.name == "ozzeh"
+    assert sources[0].lookups == []
+
+
+def test_reflect_events_through_federation(federated_registries, federated_event):
+    events = [dict(federated_event, id=str(i), detail={"name": str(i)}) for i in range(6)]
+
+    # Neither the workers nor this process have reflected the schema yet, so
+    # both have to resolve it through the pickled federated registry.
+    context = multiprocessing.get_context("fork")
+    with FederatedSchemaRegistry(federated_registries) as federated:
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            models = list(
+                reflect_events(events, registry=federated, executor=executor, batch_size=2)
+            )
+
+    assert [m.name for m in models] == [str(i) for i in range(6)]
+    assert models[0].detail_type == "TAPI-TEST/schema_registry.test.FederatedModel:1"
+
+
+def test_registries_pickle_by_spec():
+    registry = SchemaRegistry("TAPI-TEST", region_name="eu-west-1")
+    restored = pickle.loads(pickle.dumps(registry))
+
+    assert restored is not registry
+    assert restored.registry_name == "TAPI-TEST"
+    assert restored.session.region_name == "eu-west-1"
+    assert pickle.loads(pickle.dumps(registry)) is restored
@@ -0,0 +1,63 @@
+import pickle
+
+from datetime import datetime
+
+import pytest
+
+from pydantic import ValidationError
+
+from schema_registry.reflection import SchemaReflector
+
+
+@pytest.fixture(scope="module")
+def lazy_model():
+    item = {
+        "title": "LazyModel",
+        "type": "object",
+        "properties": {
+            "name": {"title": "Name", "type": "string"},
+            "timestamp": {"title": "Timestamp", "type": "string", "format": "date-time"},
+            "group": {"$ref": "#/definitions/LazyGroup"},
+        },
+        "required": ["name", "group"],
+        "definitions": {
+            "LazyGroup": {
+                "title": "LazyGroup",
+                "type": "object",
+                "properties": {"id": {"title": "Id", "type": "integer"}},
+                "required": ["id"],
+            }
+        },
+    }
+    yield SchemaReflector(item).create_model_for_jsonschema()
+
+
+def test_fields_are_validated_on_access(lazy_model):
+    lazy = lazy_model.parse_lazy(
+        {"name": "ozzeh", "timestamp": "2020-11-27T16:53:00Z", "group": {"id": "x"}}
+    )
+
+    assert lazy.name == "ozzeh"
+    assert isinstance(lazy.timestamp, datetime)
+    assert lazy.timestamp is lazy.timestamp
+
+    with pytest.raises(ValidationError):
+        lazy.group
+
+
+def test_missing_fields(lazy_model):
+    lazy = lazy_model.parse_lazy({"group": {"id": 1}})
+
+    assert lazy.timestamp is None
+    with pytest.raises(ValidationError):
+        lazy.name
+    with pytest.raises(AttributeError):
+        lazy.not_a_field
+
+
+def test_full_validation(lazy_model):
+    data = {"name": "ozzeh", "group": {"id": "1"}}
+    lazy = lazy_model.parse_lazy(data)
+
+    assert lazy.validate() == lazy_model.parse_obj(data)
+    assert pickle.loads(pickle.dumps(lazy)).group.id == 1
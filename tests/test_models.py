@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from schema_registry.models import _SchemaContentModel, _SchemaVersionRecord
+
+
+@pytest.fixture(scope="module")
+def content_model():
+    content = {"title": "TestingModel", "type": "object", "properties": {}}
+    response = {
+        "SchemaArn": "arn:aws:schemas:eu-west-1:740218546536:schema/TAPI-TEST/schema_registry.test.TestingModel",
+        "SchemaName": "schema_registry.test.TestingModel",
+        "SchemaVersion": "1",
+        "Type": "JSONSchemaDraft4",
+        "VersionCreatedDate": "2020-11-27T16:53:00Z",
+        "Content": json.dumps(content),
+    }
+    yield _SchemaContentModel.parse_obj(response)
+
+
+def test_version_record(content_model):
+    record = _SchemaVersionRecord.from_content_model(content_model)
+
+    assert record.schema_arn == content_model.schema_arn
+    assert record.version_created_date == content_model.version_created_date
+    assert record.content == content_model.content
+    assert record.content_dict == content_model.content_dict
+    assert not hasattr(record, "__dict__")
+
+
+def test_version_record_content_is_not_shared(content_model):
+    record = _SchemaVersionRecord.from_content_model(content_model)
+
+    record.content_dict["title"] = "Changed"
+    assert record.content_dict["title"] == "TestingModel"
+
+
+def test_version_record_model_surface(content_model):
+    record = _SchemaVersionRecord.from_content_model(content_model)
+
+    assert record.dict() == content_model.dict()
+    assert record.dict(by_alias=True) == content_model.dict(by_alias=True)
+    assert json.loads(record.json()) == json.loads(content_model.json())
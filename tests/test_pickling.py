@@ -0,0 +1,116 @@
+import multiprocessing
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from schema_registry.parallel import reflect_events
+from schema_registry import reflection
+from schema_registry.reflection import SchemaReflector, model_for_detail_type
+
+DETAIL_TYPE = "TAPI-TEST/schema_registry.test.PickledModel:1"
+
+
+@pytest.fixture(scope="module")
+def pickled_schema():
+    item = {
+        "title": "PickledModel",
+        "type": "object",
+        "properties": {
+            "name": {"title": "Name", "type": "string"},
+            "timestamp": {"title": "Timestamp", "type": "string", "format": "date-time"},
+            "group": {"$ref": "#/definitions/PickledGroup"},
+        },
+        "required": ["name", "group"],
+        "definitions": {
+            "PickledGroup": {
+                "title": "PickledGroup",
+                "type": "object",
+                "properties": {"id": {"title": "Id", "type": "integer"}},
+                "required": ["id"],
+            }
+        },
+    }
+    yield item
+
+
+@pytest.fixture(scope="module")
+def fake_registry(pickled_schema, fake_registry_factory):
+    yield fake_registry_factory({"schema_registry.test.PickledModel": pickled_schema})
+
+
+def test_reflected_model_round_trip(pickled_schema):
+    model = SchemaReflector(pickled_schema).create_model_for_jsonschema()
+    instance = model.parse_obj({"name": "ozzeh", "group": {"id": 1}})
+
+    assert pickle.loads(pickle.dumps(model)) is model
+    assert pickle.loads(pickle.dumps(instance)) == instance
+
+
+def test_reflection_is_not_cached(pickled_schema):
+    cached = len(reflection._schema_models)
+    SchemaReflector(pickled_schema).create_model_for_jsonschema()
+    assert len(reflection._schema_models) == cached
+
+
+def test_detail_type_model_round_trip(fake_registry):
+    model = model_for_detail_type(DETAIL_TYPE, registry=fake_registry)
+    instance = model.parse_obj({"name": "ozzeh", "group": {"id": 1}})
+
+    data = pickle.dumps(instance)
+    assert DETAIL_TYPE.encode() in data
+    assert pickle.loads(data) == instance
+
+
+def test_reflect_events_on_process_pool(fake_registry):
+    model = model_for_detail_type(DETAIL_TYPE, registry=fake_registry)
+    events = [
+        {
+            "version": "0",
+            "id": str(i),
+            "detail-type": DETAIL_TYPE,
+            "source": "com.pleaseignore.tvm.test",
+            "account": "740218546536",
+            "time": "2020-11-27T16:53:00Z",
+            "region": "eu-west-1",
+            "resources": [],
+            "detail": {"name": str(i), "group": {"id": i}},
+        }
+        for i in range(10)
+    ]
+
+    # Forked workers inherit the reflected model cache, so no registry is hit.
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        models = list(reflect_events(events, executor=executor, batch_size=3))
+
+    assert [m.name for m in models] == [str(i) for i in range(10)]
+    assert all(type(m) is model for m in models)
+
+
+def test_reflect_events_bounds_input(fake_registry):
+    model_for_detail_type(DETAIL_TYPE, registry=fake_registry)
+    consumed = []
+
+    def events():
+        for i in range(5000):
+            consumed.append(i)
+            yield {
+                "version": "0",
+                "id": str(i),
+                "detail-type": DETAIL_TYPE,
+                "source": "com.pleaseignore.tvm.test",
+                "account": "740218546536",
+                "time": "2020-11-27T16:53:00Z",
+                "region": "eu-west-1",
+                "resources": [],
+                "detail": {"name": str(i), "group": {"id": i}},
+            }
+
+    context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+        models = reflect_events(events(), executor=executor, max_workers=2, batch_size=10)
+        next(models)
+        assert len(consumed) <= 5 * 10
+        models.close()